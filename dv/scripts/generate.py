@@ -1,10 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 from pathlib import Path
 import pandas as pd
 import numpy as np
-import json
-import random
-import string
-from datetime import date, timedelta
+import pyarrow as pa
+from pyarrow import csv as pacsv
+import pyarrow.parquet as pq
+import orjson
+from datetime import date
+from functools import lru_cache
+from typing import Literal
 from faker import Faker
 
 num_customers = 3000
@@ -16,96 +21,261 @@ num_users = 3500
 num_payments = 6000
 num_payment_methods = 5
 
+# Tabular output: "csv", "parquet" or "both" (saas_orders is always JSON)
+OutFormat = Literal["csv", "parquet", "both"]
+out_format: OutFormat = "csv"
+
+# Storage for string columns of the SaaS/payments frames
+STRING_DTYPE = "string[pyarrow]"
+
+# SaaS + payments rows below which those generators run serially, per
+# multiprocessing start method. The orders task dominates, so a parallel
+# run only saves the users/payments time (~0.75 s per million rows).
+# Forked workers start almost for free; spawn/forkserver workers
+# re-import the module (~1.5 s each). At the default sizes (~29.5k rows)
+# the pool is therefore opt-in: raise the row counts or lower these.
+PARALLEL_MIN_ROWS = {"fork": 250_000, "spawn": 2_000_000, "forkserver": 2_000_000}
+
+# Output buffer size for CSV writers
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Base path
 BASE_PATH = Path(__file__).parent.parent / "data"
 BASE_PATH.mkdir(parents=True, exist_ok=True)
 
 # Seeds
-random.seed(42)
 np.random.seed(42)
-fake = Faker()
-Faker.seed(42)
-
-
-def random_string(prefix, length=5):
-    return prefix + "".join(random.choices(string.digits, k=length))
-
-
-def random_country():
-    countries = [
-        "United States",
-        "USA",
-        "Germany",
-        "DE",
-        "India",
-        "IND",
-        "Canada",
-        "CA",
-        "US",
-        fake.country(),
-    ]
-    return random.choice(countries)
 
+# Number of pre-sampled values per Faker provider
+POOL_SIZE = 2048
+
+
+@lru_cache(maxsize=None)
+def _pool(provider: str, size: int = POOL_SIZE) -> np.ndarray:
+    """
+    Pre-sample `size` values from one Faker provider, built on first use;
+    columns are drawn from these with NumPy instead of calling the provider
+    once per row. Each pool gets its own Faker seeded with 42, so its
+    contents don't depend on which process builds it or in what order, and
+    the Faker instance can be freed once this returns.
+    """
+    fake = Faker()
+    fake.seed_instance(42)
+    provide = getattr(fake, provider)
+    return np.array([provide() for _ in range(size)], dtype=object)
+
+
+def write_table(
+    df: pd.DataFrame,
+    out_dir: Path,
+    name: str,
+    out_format: OutFormat = "csv",
+):
+    """
+    Write a DataFrame (no index) as `<name>.csv` and/or `<name>.parquet`.
+    The Arrow table is built once and shared by both writers; CSV output
+    is buffered in 1 MiB chunks.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if out_format in ("csv", "both"):
+        csv_path = str(out_dir / f"{name}.csv")
+        with pa.output_stream(csv_path, buffer_size=WRITE_BUFFER_SIZE) as sink:
+            pacsv.write_csv(table, sink)
+    if out_format in ("parquet", "both"):
+        pq.write_table(table, out_dir / f"{name}.parquet", compression="snappy")
 
-def random_customer_name():
-    return random.choice(
+
+def random_strings(prefix, n, length=5):
+    """
+    Generate `n` IDs of `prefix` followed by `length` zero-padded digits.
+    """
+    nums = np.random.randint(0, 10**length, n)
+    return np.char.mod(f"{prefix}%0{length}d", nums)
+
+
+def _sample(pool, size):
+    """
+    Draw `size` values uniformly (with replacement) from a pre-built pool.
+    """
+    return pool[np.random.randint(0, len(pool), size)]
+
+
+def _sample_distinct(provider: str, size: int):
+    """
+    Draw `size` values of a high-cardinality Faker provider (addresses,
+    person names) without replacement from a pool of at least `size`
+    values, so the column keeps roughly the uniqueness of per-row Faker
+    calls instead of repeating entries of a fixed-size pool.
+    """
+    pool = _pool(provider, max(POOL_SIZE, size))
+    return pool[np.random.permutation(len(pool))[:size]]
+
+
+def random_country(size):
+    countries = np.array(
         [
-            fake.company(),
-            fake.company_suffix() + " " + fake.last_name(),
-            fake.bs().title(),
-        ]
+            "United States",
+            "USA",
+            "Germany",
+            "DE",
+            "India",
+            "IND",
+            "Canada",
+            "CA",
+            "US",
+        ],
+        dtype=object,
+    )
+    # One extra slot stands in for a Faker country name
+    picks = np.random.randint(0, len(countries) + 1, size)
+    faker_mask = picks == len(countries)
+    result = countries[np.where(faker_mask, 0, picks)]
+    result[faker_mask] = _sample(_pool("country"), faker_mask.sum())
+    return result
+
+
+def random_customer_name(size):
+    forms = np.random.randint(0, 3, size)
+    suffixed = (
+        _sample(_pool("company_suffix"), size) + " " + _sample(_pool("last_name"), size)
+    )
+    titled_bs = np.char.title(_sample(_pool("bs"), size).astype(str)).astype(object)
+    return np.select(
+        [forms == 0, forms == 1],
+        [_sample(_pool("company"), size), suffixed],
+        titled_bs,
     )
 
 
-def introduce_null(value, prob=0.05):
-    return value if random.random() > prob else None
+def random_product_name(size):
+    forms = np.random.randint(0, 3, size)
+    titled_word = np.char.title(_sample(_pool("word"), size).astype(str)).astype(object)
+    colored = (
+        _sample(_pool("color_name"), size)
+        + " "
+        + np.char.title(_sample(_pool("word"), size).astype(str)).astype(object)
+    )
+    return np.select(
+        [forms == 0, forms == 1],
+        [titled_word, _sample(_pool("catch_phrase"), size)],
+        colored,
+    )
 
 
-def inconsistent_id(base_id: str):
+def random_dates(n, start=date(2020, 1, 1), end=date(2022, 12, 31)):
+    """
+    Draw `n` ISO-formatted dates uniformly from [start, end] by sampling
+    day ordinals and indexing a lookup table of pre-formatted strings.
+    """
+    start_ord, end_ord = start.toordinal(), end.toordinal()
+    lut = np.array(
+        [date.fromordinal(o).isoformat() for o in range(start_ord, end_ord + 1)]
+    )
+    return lut[np.random.randint(0, end_ord - start_ord + 1, n)]
+
+
+def introduce_null(values, prob=0.05):
+    return np.where(np.random.random(len(values)) < prob, None, values)
+
+
+def inconsistent_id(base_ids):
     """
     Introduce simple ID inconsistencies:
     - Sometimes add a dash after prefix
     - Sometimes lowercase
     """
-    if random.random() < 0.2:
-        base_id = base_id.replace("CUST", "CUST-")
-    if random.random() < 0.1:
-        base_id = base_id.lower()
-    return base_id
+    base_ids = np.asarray(base_ids, dtype=str)
+    dash_mask = np.random.random(len(base_ids)) < 0.2
+    base_ids = np.where(dash_mask, np.char.replace(base_ids, "CUST", "CUST-"), base_ids)
+    lower_mask = np.random.random(len(base_ids)) < 0.1
+    return np.where(lower_mask, np.char.lower(base_ids), base_ids)
 
 
 # ---------------------------
 # CDC helper for ERP tables
 # ---------------------------
-def _mutate_row_for_table(row: pd.Series, table_name: str) -> pd.Series:
+def _mutate_customers(rows: pd.DataFrame):
+    # Change country or name
+    country_mask = np.random.random(len(rows)) < 0.5
+    rows.loc[country_mask, "country"] = random_country(country_mask.sum())
+    rows.loc[~country_mask, "customer_name"] = random_customer_name(
+        (~country_mask).sum()
+    )
+
+
+def _mutate_addresses(rows: pd.DataFrame):
+    # Change city/state/postal code
+    city_mask = np.random.random(len(rows)) < 0.33
+    state_mask = ~city_mask & (np.random.random(len(rows)) < 0.66)
+    postal_mask = ~city_mask & ~state_mask
+    rows.loc[city_mask, "city"] = _sample(_pool("city"), city_mask.sum())
+    rows.loc[state_mask, "state"] = _sample(_pool("state"), state_mask.sum())
+    rows.loc[postal_mask, "postal_code"] = _sample(_pool("postcode"), postal_mask.sum())
+
+
+def _mutate_products(rows: pd.DataFrame):
+    # Change price a bit or tweak name
+    price_mask = np.random.random(len(rows)) < 0.6
+    factors = np.random.choice([0.9, 0.95, 1.05, 1.1], price_mask.sum())
+    rows.loc[price_mask, "price"] = (
+        rows.loc[price_mask, "price"].astype(float) * factors
+    ).round(2)
+    rows.loc[~price_mask, "product_name"] = (
+        rows.loc[~price_mask, "product_name"] + " v2"
+    )
+
+
+# Per-table in-place mutators applying a small 'business-meaningful'
+# change to each row to simulate UPDATE events.
+_ROW_MUTATORS = {
+    "erp_customers": _mutate_customers,
+    "erp_customer_addresses": _mutate_addresses,
+    "erp_products": _mutate_products,
+}
+
+
+# cdc_op codes, in the order of their categories
+CDC_OPS = ["I", "U", "D"]
+OP_INSERT, OP_UPDATE, OP_DELETE = range(len(CDC_OPS))
+
+
+def _build_cdc_events(
+    base_ts: np.ndarray,
+    end_ts: int,
+    u_mask: np.ndarray,
+    d_mask: np.ndarray,
+    delta_u: np.ndarray,
+    delta_d: np.ndarray,
+):
     """
-    Apply a small 'business-meaningful' change per table
-    to simulate UPDATE events.
+    Lay out the CDC events for each source row as flat arrays:
+      - INSERT at base_ts for every row
+      - UPDATE where u_mask, delta_u days later
+      - DELETE where d_mask, delta_d days after the last event
+    Timestamps are int day numbers and never move past end_ts.
+
+    Returns (row_idx, op, seq, ts) with all inserts first, then updates,
+    then deletes, each in source row order. `op` holds int8 codes into
+    CDC_OPS and `seq` is int8 (at most 3 events per row).
     """
-    row = row.copy()
-    if table_name == "erp_customers":
-        # Change country or name
-        if random.random() < 0.5:
-            row["country"] = random_country()
-        else:
-            row["customer_name"] = random_customer_name()
-    elif table_name == "erp_customer_addresses":
-        # Change city/state/postal code
-        if random.random() < 0.33:
-            row["city"] = fake.city()
-        elif random.random() < 0.66:
-            row["state"] = fake.state()
-        else:
-            row["postal_code"] = fake.postcode()
-    elif table_name == "erp_products":
-        # Change price a bit or tweak name
-        if random.random() < 0.6:
-            old_price = float(row["price"])
-            factor = random.choice([0.9, 0.95, 1.05, 1.1])
-            row["price"] = round(old_price * factor, 2)
-        else:
-            row["product_name"] = row["product_name"] + " v2"
-    return row
+    rows = np.arange(len(base_ts))
+    upd_ts = np.minimum(base_ts + delta_u, end_ts)
+    del_ts = np.minimum(np.where(u_mask, upd_ts, base_ts) + delta_d, end_ts)
+
+    row_idx = np.concatenate([rows, rows[u_mask], rows[d_mask]])
+    op = np.repeat(
+        np.array([OP_INSERT, OP_UPDATE, OP_DELETE], dtype="int8"),
+        [len(rows), u_mask.sum(), d_mask.sum()],
+    )
+    seq = np.concatenate(
+        [
+            np.ones(len(rows), dtype="int8"),
+            np.full(u_mask.sum(), 2, dtype="int8"),
+            np.where(u_mask, 3, 2).astype("int8")[d_mask],
+        ]
+    )
+    ts = np.concatenate([base_ts, upd_ts[u_mask], del_ts[d_mask]])
+    return row_idx, op, seq, ts
 
 
 def generate_erp_cdc(
@@ -113,6 +283,7 @@ def generate_erp_cdc(
     key_col: str,
     table_name: str,
     out_dir: Path,
+    out_format: OutFormat = "csv",
     start: date = date(2020, 1, 1),
     end: date = date(2022, 12, 31),
     p_update: float = 0.4,
@@ -120,7 +291,7 @@ def generate_erp_cdc(
 ) -> pd.DataFrame:
     """
     Generate a CDC stream for an ERP table based on a static snapshot.
-    Outputs a CSV named `<table_name>_cdc.csv` with:
+    Outputs `<table_name>_cdc.csv` (and/or `.parquet`, per out_format) with:
       - cdc_table
       - cdc_op (I/U/D)
       - cdc_ts
@@ -129,86 +300,68 @@ def generate_erp_cdc(
 
     Only rows with non-null key_col are included.
     """
-    records = []
-
     # Only include rows with a business key
     working_df = base_df[base_df[key_col].notna()].reset_index(drop=True)
+    n = len(working_df)
+
+    # Base INSERT timestamp (as a day number): created_at if present;
+    # else random in range
+    start_day = np.datetime64(start, "D").astype("int64")
+    end_day = np.datetime64(end, "D").astype("int64")
+    base_ts = np.random.randint(start_day, end_day + 1, n)
+    if "created_at" in working_df.columns:
+        # created_at is ISO formatted (we wrote it), so let NumPy parse it
+        # directly instead of going through pandas' format inference
+        created_at = working_df["created_at"].to_numpy(dtype="datetime64[D]")
+        base_ts = np.where(np.isnat(created_at), base_ts, created_at.astype("int64"))
+
+    # Optional UPDATE then DELETE event; each moves ts forward, capped at end
+    u_mask = np.random.random(n) < p_update
+    d_mask = np.random.random(n) < p_delete
+    row_idx, ops, seqs, ts = _build_cdc_events(
+        base_ts,
+        end_day,
+        u_mask,
+        d_mask,
+        delta_u=np.random.randint(1, 366, n),
+        delta_d=np.random.randint(1, 366, n),
+    )
 
-    for _, row in working_df.iterrows():
-        key_value = row[key_col]
-
-        # Base INSERT event
-        # Use created_at if present; else random in range
-        if "created_at" in row.index and pd.notna(row["created_at"]):
-            try:
-                base_ts = pd.to_datetime(row["created_at"]).date()
-            except Exception:
-                base_ts = fake.date_between(start_date=start, end_date=end)
-        else:
-            base_ts = fake.date_between(start_date=start, end_date=end)
-
-        cdc_seq = 1
-        insert_event = {
-            "cdc_table": table_name,
-            "cdc_op": "I",
-            "cdc_ts": base_ts.isoformat(),
-            "cdc_seq": cdc_seq,
-        }
-        insert_event.update(row.to_dict())
-        records.append(insert_event)
-
-        current_ts = base_ts
-
-        # Optional UPDATE event
-        if random.random() < p_update:
-            cdc_seq += 1
-            # ensure ts moves forward
-            delta_days = random.randint(1, 365)
-            upd_ts = current_ts + timedelta(days=delta_days)
-            if upd_ts > end:
-                upd_ts = end
-
-            updated_row = _mutate_row_for_table(row, table_name)
-
-            update_event = {
-                "cdc_table": table_name,
-                "cdc_op": "U",
-                "cdc_ts": upd_ts.isoformat(),
-                "cdc_seq": cdc_seq,
-            }
-            update_event.update(updated_row.to_dict())
-            records.append(update_event)
-            current_ts = upd_ts
-            row = updated_row  # latest state
-
-        # Optional DELETE event
-        if random.random() < p_delete:
-            cdc_seq += 1
-            delta_days = random.randint(1, 365)
-            del_ts = current_ts + timedelta(days=delta_days)
-            if del_ts > end:
-                del_ts = end
-
-            delete_event = {
-                "cdc_table": table_name,
-                "cdc_op": "D",
-                "cdc_ts": del_ts.isoformat(),
-                "cdc_seq": cdc_seq,
-            }
-            delete_event.update(row.to_dict())
-            records.append(delete_event)
-
-    cdc_df = pd.DataFrame(records)
+    updated_df = working_df[u_mask].copy()
+    mutate = _ROW_MUTATORS.get(table_name)
+    if mutate is not None:
+        mutate(updated_df)
+
+    # Row states: originals, then updated copies at offset n. Inserts read
+    # the original; later events read the latest state of their row.
+    states_df = pd.concat([working_df, updated_df], ignore_index=True)
+    latest_idx = np.arange(n)
+    latest_idx[u_mask] = n + np.arange(u_mask.sum())
+    sources = np.where(ops == OP_INSERT, row_idx, latest_idx[row_idx])
+
+    cdc_df = (
+        states_df.iloc[sources]
+        .reset_index(drop=True)
+        .assign(
+            cdc_op=pd.Categorical.from_codes(ops, categories=CDC_OPS),
+            cdc_ts=np.datetime_as_string(ts.astype("datetime64[D]"), unit="D"),
+            cdc_seq=seqs,
+        )
+    )
+    cdc_df["cdc_table"] = table_name
+    cdc_df = cdc_df[["cdc_table", "cdc_op", "cdc_ts", "cdc_seq", *working_df.columns]]
 
     # Order by key + timestamp + seq
-    cdc_df.sort_values(
-        by=[key_col, "cdc_ts", "cdc_seq"],
-        inplace=True,
-        ignore_index=True,
+    order = np.lexsort(
+        (
+            cdc_df["cdc_seq"].to_numpy(),
+            cdc_df["cdc_ts"].to_numpy(),
+            cdc_df[key_col].to_numpy(),
+        )
     )
+    cdc_df = cdc_df.iloc[order].reset_index(drop=True)
 
-    out_path = out_dir / f"{table_name}_cdc.csv"
-    cdc_df.to_csv(out_path, index=False)
+    write_table(cdc_df, out_dir, f"{table_name}_cdc", out_format)
     return cdc_df
 
 
@@ -220,6 +373,7 @@ def generate_erp_data(
     num_addresses: int,
     num_products: int,
     out_dir: Path = BASE_PATH,
+    out_format: OutFormat = "csv",
 ):
     """
     Generate sample ERP data:
@@ -229,73 +383,54 @@ def generate_erp_data(
     """
 
     # --- Customers snapshot ---
-    erp_customers = []
-    for _ in range(num_customers):
-        raw_id = random_string("CUST")
-        # ~2.5% missing IDs
-        cust_id = inconsistent_id(raw_id) if random.random() > 0.025 else None
-
-        name = random_customer_name()
-        country = introduce_null(random_country(), prob=0.05)
-        created_at = fake.date_between(
-            start_date=date(2020, 1, 1),
-            end_date=date(2022, 12, 31),
-        )
-
-        erp_customers.append(
-            [
-                cust_id,
-                name,
-                country,
-                str(created_at),
-            ]
-        )
+    cust_ids = random_strings("CUST", num_customers)
 
     erp_customers_df = pd.DataFrame(
-        erp_customers,
-        columns=["customer_id", "customer_name", "country", "created_at"],
+        {
+            # ~2.5% missing IDs
+            "customer_id": introduce_null(inconsistent_id(cust_ids), prob=0.025),
+            "customer_name": random_customer_name(num_customers),
+            "country": introduce_null(random_country(num_customers), prob=0.05),
+            "created_at": random_dates(num_customers),
+        }
     )
-    erp_customers_df.to_csv(out_dir / "erp_customers.csv", index=False)
+    write_table(erp_customers_df, out_dir, "erp_customers", out_format)
 
     # --- Addresses snapshot ---
-    erp_addresses = []
-    customer_ids = erp_customers_df["customer_id"].dropna().tolist()
-    for _ in range(num_addresses):
-        cust_id = random.choice(customer_ids + [None])
-        address = fake.street_address()
-        city = fake.city()
-        postal_code = fake.postcode()
-        state = fake.state()
-        erp_addresses.append([cust_id, address, city, state, postal_code])
+    customer_ids = erp_customers_df["customer_id"].dropna().to_numpy()
+    # Same odds as picking uniformly from customer_ids + [None]
+    address_cust_ids = np.where(
+        np.random.random(num_addresses) < 1 / (len(customer_ids) + 1),
+        None,
+        _sample(customer_ids, num_addresses),
+    )
 
     erp_addresses_df = pd.DataFrame(
-        erp_addresses,
-        columns=["customer_id", "address", "city", "state", "postal_code"],
+        {
+            "customer_id": address_cust_ids,
+            "address": _sample_distinct("street_address", num_addresses),
+            "city": _sample(_pool("city"), num_addresses),
+            "state": _sample(_pool("state"), num_addresses),
+            "postal_code": _sample(_pool("postcode"), num_addresses),
+        }
     )
-    erp_addresses_df.to_csv(out_dir / "erp_customer_addresses.csv", index=False)
+    write_table(erp_addresses_df, out_dir, "erp_customer_addresses", out_format)
 
     # --- Products snapshot ---
-    erp_products = []
-    for _ in range(num_products):
-        product_id = random_string("PROD")
-        product_name = random.choice(
-            [
-                fake.word().title(),
-                fake.catch_phrase(),
-                fake.color_name() + " " + fake.word().title(),
-            ]
-        )
-        price = round(random.uniform(10, 500), 2)
-        category = random.choice(
-            ["Hardware", "Software", "Subscription", "Service", "Consumables"]
-        )
-        erp_products.append([product_id, product_name, category, price])
+    product_ids = random_strings("PROD", num_products)
+    categories = np.array(
+        ["Hardware", "Software", "Subscription", "Service", "Consumables"]
+    )
 
     erp_products_df = pd.DataFrame(
-        erp_products,
-        columns=["product_id", "product_name", "category", "price"],
+        {
+            "product_id": product_ids,
+            "product_name": random_product_name(num_products),
+            "category": np.random.choice(categories, num_products),
+            "price": np.random.uniform(10, 500, num_products).round(2),
+        }
     )
-    erp_products_df.to_csv(out_dir / "erp_products.csv", index=False)
+    write_table(erp_products_df, out_dir, "erp_products", out_format)
 
     # --- CDC generation for ERP tables ---
     customers_cdc_df = generate_erp_cdc(
@@ -303,6 +438,7 @@ def generate_erp_data(
         key_col="customer_id",
         table_name="erp_customers",
         out_dir=out_dir,
+        out_format=out_format,
         start=date(2020, 1, 1),
         end=date(2024, 12, 31),
     )
@@ -312,6 +448,7 @@ def generate_erp_data(
         key_col="customer_id",
         table_name="erp_customer_addresses",
         out_dir=out_dir,
+        out_format=out_format,
         start=date(2020, 1, 1),
         end=date(2024, 12, 31),
     )
@@ -321,6 +458,7 @@ def generate_erp_data(
         key_col="product_id",
         table_name="erp_products",
         out_dir=out_dir,
+        out_format=out_format,
         start=date(2020, 1, 1),
         end=date(2024, 12, 31),
     )
@@ -335,149 +473,164 @@ def generate_erp_data(
 
 
 # ---------------------------
-# SaaS + Payments (unchanged)
+# SaaS + Payments
 # ---------------------------
-def generate_saas_data(
-    num_orders: int,
-    num_order_items: int,
+def generate_saas_users(
     num_users: int,
-    erp_customers_df: pd.DataFrame,
-    erp_products_df: pd.DataFrame,
     out_dir: Path = BASE_PATH,
+    out_format: OutFormat = "csv",
 ):
     """
-    Generate SaaS system data:
+    Generate SaaS users:
     - saas_users.csv
-    - saas_orders.json
-    - saas_order_items.csv
     """
-    saas_users = []
-    for _ in range(num_users):
-        user_id = random_string("USER")
-        person_name = fake.name()
-        email_local = person_name.replace(" ", ".").replace("'", "").lower()
-        domain = random.choice(["example.com", "acme.io", "saasapp.com"])
-        email = f"{email_local}{random.randint(1, 999)}@{domain}"
-        saas_users.append([user_id, person_name, email])
-
-    saas_users_df = pd.DataFrame(saas_users, columns=["user_id", "name", "email"])
-    saas_users_df.to_csv(out_dir / "saas_users.csv", index=False)
-
-    saas_orders = []
-    customer_ids = erp_customers_df["customer_id"].dropna().tolist()
-    statuses = ["Shipped", "shipped", "Pending", "pending", "Delivered"]
-
-    for _ in range(num_orders):
-        order_id = random_string("ORD")
-        customer_ref = random.choice(customer_ids + [random_string("CUST")])
-        order_date = fake.date_between(
-            start_date=date(2020, 1, 1),
-            end_date=date(2022, 12, 31),
-        )
+    names = pd.Series(_sample_distinct("name", num_users))
+    email_locals = (
+        names.str.replace(" ", ".", regex=False)
+        .str.replace("'", "", regex=False)
+        .str.lower()
+    )
+    domains = np.random.choice(["example.com", "acme.io", "saasapp.com"], num_users)
+    emails = (
+        email_locals + np.random.randint(1, 1000, num_users).astype(str) + "@" + domains
+    )
 
-        amount = introduce_null(
-            round(random.uniform(100, 5000), 2),
-            prob=0.035,
-        )
-        status = random.choice(statuses)
-        currency = random.choice(["USD", "EUR", "INR", "CAD"])
-
-        saas_orders.append(
-            {
-                "order_id": order_id,
-                "customer_ref": customer_ref,
-                "order_date": str(order_date),
-                "amount": amount,
-                "currency": currency,
-                "status": status,
-            }
-        )
+    saas_users_df = pd.DataFrame(
+        {
+            "user_id": random_strings("USER", num_users),
+            "name": names,
+            "email": emails,
+        }
+    ).astype(STRING_DTYPE)
+    write_table(saas_users_df, out_dir, "saas_users", out_format)
+
+    return saas_users_df
 
-    with open(out_dir / "saas_orders.json", "w") as f:
-        json.dump(saas_orders, f, indent=2)
 
-    order_items = []
-    product_ids = erp_products_df["product_id"].tolist()
-    order_ids = [o["order_id"] for o in saas_orders]
+def generate_saas_orders_and_items(
+    order_ids: np.ndarray,
+    num_order_items: int,
+    customer_ids: np.ndarray,
+    product_ids: np.ndarray,
+    out_dir: Path = BASE_PATH,
+    out_format: OutFormat = "csv",
+):
+    """
+    Generate SaaS orders and their line items:
+    - saas_orders.json
+    - saas_order_items.csv
+    """
+    num_orders = len(order_ids)
+    statuses = np.array(["Shipped", "shipped", "Pending", "pending", "Delivered"])
+    currencies = np.array(["USD", "EUR", "INR", "CAD"])
+
+    customer_refs = _sample(customer_ids, num_orders)
+    # Same odds as picking from customer_ids + [an unknown customer ID]
+    unknown_mask = np.random.random(num_orders) < 1 / (len(customer_ids) + 1)
+    customer_refs[unknown_mask] = random_strings("CUST", unknown_mask.sum())
+
+    orders_df = pd.DataFrame(
+        {
+            "order_id": order_ids,
+            "customer_ref": customer_refs,
+            "order_date": random_dates(num_orders),
+            "amount": introduce_null(
+                np.random.uniform(100, 5000, num_orders).round(2), prob=0.035
+            ).astype("float64"),
+            "currency": np.random.choice(currencies, num_orders),
+            "status": np.random.choice(statuses, num_orders),
+        }
+    ).astype(
+        {
+            "order_id": STRING_DTYPE,
+            "customer_ref": STRING_DTYPE,
+            "order_date": STRING_DTYPE,
+            "currency": STRING_DTYPE,
+            "status": STRING_DTYPE,
+        }
+    )
+    # Rows are only materialized for the JSON dump (NaN amounts become null)
+    saas_orders = orders_df.to_dict("records")
 
-    for _ in range(num_order_items):
-        order_id = random.choice(order_ids)
-        product_id = random.choice(product_ids)
-        quantity = random.randint(1, 10)
-        discount_pct = random.choice([0, 0, 0, 5, 10, 15])
-        order_items.append([order_id, product_id, quantity, discount_pct])
+    (out_dir / "saas_orders.json").write_bytes(
+        orjson.dumps(saas_orders, option=orjson.OPT_INDENT_2)
+    )
 
     order_items_df = pd.DataFrame(
-        order_items,
-        columns=["order_id", "product_id", "quantity", "discount_pct"],
-    )
-    order_items_df.to_csv(out_dir / "saas_order_items.csv", index=False)
+        {
+            "order_id": _sample(order_ids, num_order_items),
+            "product_id": _sample(product_ids, num_order_items),
+            "quantity": np.random.randint(1, 11, num_order_items),
+            "discount_pct": np.random.choice([0, 0, 0, 5, 10, 15], num_order_items),
+        }
+    ).astype({"order_id": STRING_DTYPE, "product_id": STRING_DTYPE})
+    write_table(order_items_df, out_dir, "saas_order_items", out_format)
 
-    return saas_orders, saas_users_df, order_items_df
+    return saas_orders, order_items_df
 
 
 def generate_payments_data(
     num_payments: int,
-    saas_orders: list[dict],
+    order_ids: np.ndarray,
     out_dir: Path = BASE_PATH,
+    out_format: OutFormat = "csv",
 ):
     """
     Generate payments data:
     - payment_methods.csv
     - payments.csv
     """
-    payment_methods = [
-        "Credit Card",
-        "CreditCard",
-        "Bank Transfer",
-        "BankTransfer",
-        "Cash",
-    ]
-    payment_methods_df = pd.DataFrame(payment_methods, columns=["payment_method"])
-    payment_methods_df.to_csv(out_dir / "payment_methods.csv", index=False)
-
-    order_ids = [o["order_id"] for o in saas_orders]
-
-    payments = []
-    for _ in range(num_payments):
-        payment_id = random_string("PAY")
-        if random.random() > 0.065:
-            order_ref = random.choice(order_ids + [None])
-        else:
-            order_ref = None
-
-        payment_date = fake.date_between(
-            start_date=date(2020, 1, 1),
-            end_date=date(2022, 12, 31),
-        )
-        payment_amount = round(random.uniform(50, 5000), 2)
-        payment_method = random.choice(payment_methods)
-
-        payments.append(
-            [
-                payment_id,
-                order_ref,
-                str(payment_date),
-                payment_amount,
-                payment_method,
-            ]
-        )
+    payment_methods = np.array(
+        [
+            "Credit Card",
+            "CreditCard",
+            "Bank Transfer",
+            "BankTransfer",
+            "Cash",
+        ]
+    )
+    payment_methods_df = pd.DataFrame({"payment_method": payment_methods}).astype(
+        STRING_DTYPE
+    )
+    write_table(payment_methods_df, out_dir, "payment_methods", out_format)
+
+    # ~6.5% orphan payments, plus the same odds as picking from order_ids + [None]
+    null_mask = (np.random.random(num_payments) < 0.065) | (
+        np.random.random(num_payments) < 1 / (len(order_ids) + 1)
+    )
+    order_refs = np.where(null_mask, None, _sample(order_ids, num_payments))
 
     payments_df = pd.DataFrame(
-        payments,
-        columns=[
-            "payment_id",
-            "order_ref",
-            "payment_date",
-            "payment_amount",
-            "payment_method",
-        ],
+        {
+            "payment_id": random_strings("PAY", num_payments),
+            "order_ref": order_refs,
+            "payment_date": random_dates(num_payments),
+            "payment_amount": np.random.uniform(50, 5000, num_payments).round(2),
+            "payment_method": np.random.choice(payment_methods, num_payments),
+        }
+    ).astype(
+        {
+            "payment_id": STRING_DTYPE,
+            "order_ref": STRING_DTYPE,
+            "payment_date": STRING_DTYPE,
+            "payment_method": STRING_DTYPE,
+        }
     )
-    payments_df.to_csv(out_dir / "payments.csv", index=False)
+    write_table(payments_df, out_dir, "payments", out_format)
 
     return payments_df
 
 
+def _generate_in_worker(worker_id: int, func, *args):
+    """
+    Run a generator (in a pool worker or inline) with its own
+    deterministic seed. Each generator writes its own files, so nothing
+    is sent back.
+    """
+    np.random.seed(42 + worker_id)
+    func(*args)
+
+
 if __name__ == "__main__":
     (
         erp_customers_df,
@@ -490,21 +643,38 @@ if __name__ == "__main__":
         num_addresses=num_addresses,
         num_products=num_products,
         out_dir=BASE_PATH,
+        out_format=out_format,
     )
 
-    saas_orders, saas_users_df, order_items_df = generate_saas_data(
-        num_orders=num_orders,
-        num_order_items=num_order_items,
-        num_users=num_users,
-        erp_customers_df=erp_customers_df,
-        erp_products_df=erp_products_df,
-        out_dir=BASE_PATH,
-    )
+    # SaaS and payments only share these ID arrays, so they can run in
+    # parallel; each task seeds its own RNG, so output is the same either way
+    customer_ids = erp_customers_df["customer_id"].dropna().to_numpy()
+    product_ids = erp_products_df["product_id"].to_numpy()
+    order_ids = random_strings("ORD", num_orders)
+
+    tasks = [
+        (1, generate_saas_users, num_users, BASE_PATH, out_format),
+        (
+            2,
+            generate_saas_orders_and_items,
+            order_ids,
+            num_order_items,
+            customer_ids,
+            product_ids,
+            BASE_PATH,
+            out_format,
+        ),
+        (3, generate_payments_data, num_payments, order_ids, BASE_PATH, out_format),
+    ]
 
-    payments_df = generate_payments_data(
-        num_payments=num_payments,
-        saas_orders=saas_orders,
-        out_dir=BASE_PATH,
-    )
+    saas_rows = num_users + num_orders + num_order_items + num_payments
+    if saas_rows < PARALLEL_MIN_ROWS[multiprocessing.get_start_method()]:
+        for task in tasks:
+            _generate_in_worker(*task)
+    else:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(_generate_in_worker, *task) for task in tasks]
+            for future in futures:
+                future.result()
 
     print(f"Data (snapshots + CDC) generated under: {BASE_PATH.resolve()}")